@@ -2,36 +2,234 @@ import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pydantic._internal._config")
 
 import os
+import sys
 import json
+import logging
+import argparse
+import atexit
+import collections
+import functools
 import time
+import asyncio
+import hashlib
+import pickle
+import random
+import re
+import string
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
 import google.generativeai as genai
 from pathlib import Path
 from colorama import Fore, Style, init
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Initialize colorama
 init(autoreset=True)
 
+# Log level for success messages, between INFO and WARNING
+SUCCESS = 25
+logging.addLevelName(SUCCESS, "SUCCESS")
+
+class ColoredFormatter(logging.Formatter):
+    """Prefix messages with a status marker, colored when writing to a terminal."""
+    
+    PREFIXES = {
+        logging.INFO: (Fore.CYAN, "[*]"),
+        SUCCESS: (Fore.GREEN, "[+]"),
+        logging.WARNING: (Fore.YELLOW, "[!]"),
+        logging.ERROR: (Fore.RED, "[X]"),
+    }
+    
+    def __init__(self, use_color):
+        super().__init__()
+        self.use_color = use_color
+    
+    def format(self, record):
+        color, prefix = self.PREFIXES.get(record.levelno, ("", f"[{record.levelname}]"))
+        message = f"{prefix} {super().format(record)}"
+        if self.use_color and color:
+            message = f"{color}{message}{Style.RESET_ALL}"
+        return message
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(ColoredFormatter(use_color=sys.stdout.isatty()))
+logger.addHandler(_handler)
+
+# Number of log records kept and shown at exit in quiet mode
+QUIET_TAIL = 50
+
+class TailBufferHandler(logging.Handler):
+    """Keep the most recent records in memory and write them out only on flush.
+    
+    Records at ERROR or above flush the buffer straight away, so failures are
+    shown with the messages that led up to them.
+    """
+    
+    def __init__(self, capacity=QUIET_TAIL, stream=None):
+        super().__init__()
+        self.buffer = collections.deque(maxlen=capacity)
+        self.stream = stream or sys.stdout
+    
+    def emit(self, record):
+        self.buffer.append(record)
+        if record.levelno >= logging.ERROR:
+            self.flush()
+    
+    def flush(self):
+        self.acquire()
+        try:
+            if self.buffer:
+                self.stream.write("".join(self.format(r) + "\n" for r in self.buffer))
+                self.stream.flush()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+_quiet = False
+
+def enable_quiet_mode(capacity=QUIET_TAIL):
+    """
+    Buffer log output and only print the last `capacity` records on exit or failure.
+    
+    Returns:
+        TailBufferHandler: The handler now holding the log records
+    """
+    global _quiet
+    _quiet = True
+    # A forked worker inherits the parent's buffer; drop it so parent records aren't repeated
+    for handler in list(logger.handlers):
+        if isinstance(handler, TailBufferHandler):
+            logger.removeHandler(handler)
+    tail_handler = TailBufferHandler(capacity)
+    tail_handler.setFormatter(_handler.formatter)
+    logger.removeHandler(_handler)
+    logger.addHandler(tail_handler)
+    atexit.register(tail_handler.flush)
+    return tail_handler
+
+def write_banner(text):
+    """Write a block of console output in one call, unless INFO output is disabled."""
+    if not _quiet and logger.isEnabledFor(logging.INFO):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
 # Configure Gemini API
 GEMINI_API_KEY = ""
 genai.configure(api_key=GEMINI_API_KEY)
 
-def print_step(step_text):
-    """Print a step message with Cyan color."""
-    print(f"{Fore.CYAN}[*] {step_text}{Style.RESET_ALL}")
+# Gemini model used for generation
+MODEL_NAME = 'gemini-2.0-flash-exp'
+
+# Maximum number of Gemini requests in flight at once
+MAX_CONCURRENCY = 8
+
+# Send a tiny request before the first uncached article so its connection is reused
+# by the rest (set WARMUP=0 to disable)
+WARMUP = os.getenv('WARMUP', '1') == '1'
+
+# Upper bound on the retry backoff, in seconds (before jitter)
+MAX_BACKOFF = 30
+
+# Matches one whitespace-separated word, for counting words without splitting
+_WORD_RE = re.compile(r'\S+')
 
-def print_success(step_text):
-    """Print a success message with Green color."""
-    print(f"{Fore.GREEN}[+] {step_text}{Style.RESET_ALL}")
+# Persistent cache of Gemini responses, keyed by prompt and generation settings
+CACHE_PATH = ".gemini_cache.sqlite"
+CACHE_TTL = 30 * 24 * 60 * 60  # Seconds; None keeps entries forever
+CACHE_TIMEOUT = 30  # Seconds to wait for another process to release the database
 
-def print_warning(step_text):
-    """Print a warning message with Yellow color."""
-    print(f"{Fore.YELLOW}[!] {step_text}{Style.RESET_ALL}")
+class Article(BaseModel):
+    """Structured response schema for a generated article."""
+    content: str
+    meta_description: str
+    keywords: list[str]
+
+class TruncatedResponseError(Exception):
+    """Raised when Gemini stops at the output token limit, leaving the JSON incomplete."""
+
+class GeminiCache:
+    """Exact-match cache of generated articles backed by a SQLite file."""
+    
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._conn = None
+    
+    @property
+    def conn(self):
+        """Open the database on first use and purge expired entries."""
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, timeout=CACHE_TIMEOUT)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB, created_at REAL)"
+            )
+            if self.ttl is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - self.ttl,)
+                )
+            self._conn.commit()
+        return self._conn
+    
+    @staticmethod
+    def make_key(**params):
+        """Build a cache key from the model name, prompt and generation settings."""
+        return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+    
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        row = self.conn.execute(
+            "SELECT value FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        return pickle.loads(row[0]) if row else None
+    
+    def set(self, key, value):
+        """Store value under key."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(value), time.time())
+        )
+        self.conn.commit()
 
-def print_error(step_text):
-    """Print an error message with Red color."""
-    print(f"{Fore.RED}[X] {step_text}{Style.RESET_ALL}")
+cache = GeminiCache()
 
-def generate_article_with_gemini(title, description="", max_retries=3):
+@functools.lru_cache(maxsize=4)
+def get_model(name=MODEL_NAME):
+    """Return a shared GenerativeModel so its client is reused across calls."""
+    return genai.GenerativeModel(name)
+
+async def warm_up_model():
+    """Open the shared model's connection with a minimal request."""
+    try:
+        await get_model().generate_content_async(
+            "warmup",
+            generation_config=genai.types.GenerationConfig(max_output_tokens=1)
+        )
+    except Exception as e:
+        logger.warning("Warm-up request failed: %s", e)
+
+_warmup_task = None
+
+async def ensure_warmed_up():
+    """Warm up the model once per event loop; concurrent callers wait on the same request."""
+    global _warmup_task
+    if not WARMUP:
+        return
+    loop = asyncio.get_running_loop()
+    if _warmup_task is None or _warmup_task.get_loop() is not loop:
+        _warmup_task = loop.create_task(warm_up_model())
+    await asyncio.shield(_warmup_task)
+
+async def generate_article_with_gemini(title, description="", max_retries=3):
     """
     Generate a blog article using Gemini API.
     
@@ -65,259 +263,542 @@ Create a comprehensive, well-structured blog article on the following topic:
 9. Ensure content is technically accurate and up-to-date
 10. Make it SEO-friendly with natural keyword usage
 
-**Format**: Return ONLY the article content in Markdown format, starting with the title as # heading.
+**Format**: Return a JSON object with the following fields:
+- "content": ONLY the article content in Markdown format, starting with the title as # heading
+- "meta_description": a concise, SEO-friendly meta description (150-160 characters), no quotes or extra formatting
+- "keywords": a list of 8-10 relevant SEO keywords
 
-Do NOT include any preamble, explanations, or meta-commentary. Start directly with the article.
+Do NOT include any preamble, explanations, or meta-commentary in the article content. Start directly with the article.
+Do NOT wrap the article content in ```markdown fences.
 """
 
-    model = genai.GenerativeModel('gemini-2.0-flash-exp')
+    generation_settings = {
+        "temperature": 0.7,
+        "top_p": 0.95,
+        "top_k": 40,
+        # The article is escaped inside a JSON object, so leave headroom beyond its raw size
+        "max_output_tokens": 8192,
+    }
+    
+    cache_key = GeminiCache.make_key(model_name=MODEL_NAME, prompt=prompt, **generation_settings)
+    try:
+        cached = cache.get(cache_key)
+    except sqlite3.Error as e:
+        logger.warning("Could not read cache for '%s': %s", title, e)
+        cached = None
+    if cached:
+        logger.log(SUCCESS, "Loaded article from cache: '%s'", title)
+        return cached
+    
+    # Only pay for the warm-up request once an article actually needs the API
+    await ensure_warmed_up()
+    model = get_model()
     
     for attempt in range(max_retries):
         try:
-            print_step(f"Generating article for: '{title}' (Attempt {attempt + 1}/{max_retries})")
+            logger.info("Generating article for: '%s' (Attempt %d/%d)", title, attempt + 1, max_retries)
             
-            response = model.generate_content(
+            response = await model.generate_content_async(
                 prompt,
+                stream=True,
                 generation_config=genai.types.GenerationConfig(
-                    temperature=0.7,
-                    top_p=0.95,
-                    top_k=40,
-                    max_output_tokens=4096,
+                    response_mime_type="application/json",
+                    response_schema=Article,
+                    **generation_settings,
                 )
             )
             
-            content = response.text.strip()
+            # Consume the stream, yielding to other articles in between. Text is read
+            # from the merged response because chunks that only carry metadata have none
+            await response.resolve()
             
-            # Clean up the content
-            content = content.replace("```markdown", "").replace("```", "").strip()
+            # A truncated JSON object can't be parsed, and retrying the same request
+            # would hit the same limit
+            finish_reason = response.candidates[0].finish_reason if response.candidates else None
+            if getattr(finish_reason, "name", finish_reason) == "MAX_TOKENS":
+                raise TruncatedResponseError(
+                    f"Response hit the {generation_settings['max_output_tokens']} token output limit"
+                )
+            
+            article = json.loads(response.text)
+            content = article.get("content", "").strip()
             
             # Ensure title is at the top if not present
             if not content.startswith("# "):
                 content = f"# {title}\n\n" + content
             
-            # Generate meta description
-            meta_description = generate_meta_description(content)
+            meta_description = article.get("meta_description", "").strip().strip('"\'')[:160]
+            if not meta_description:
+                # Fallback: Use first paragraph
+                start = content.find('\n\n')
+                if start == -1:
+                    first_paragraph = content[:200]
+                else:
+                    end = content.find('\n\n', start + 2)
+                    first_paragraph = content[start + 2:end if end != -1 else None]
+                meta_description = first_paragraph[:157] + "..."
             
-            # Generate keywords
-            keywords = generate_keywords(title, content)
+            keywords = [k.strip() for k in article.get("keywords", []) if k.strip()]
+            if not keywords:
+                # Fallback: Use title words
+                keywords = title.lower().split()
             
-            print_success(f"Successfully generated article: '{title}'")
+            logger.log(SUCCESS, "Successfully generated article: '%s'", title)
             
-            return {
+            article_data = {
                 "title": title,
                 "content": content,
                 "meta_description": meta_description,
                 "keywords": keywords,
-                "word_count": len(content.split())
+                "word_count": sum(1 for _ in _WORD_RE.finditer(content))
             }
+            break
             
+        except TruncatedResponseError as e:
+            logger.error("Failed to generate article '%s': %s", title, e)
+            return None
         except Exception as e:
-            print_error(f"Attempt {attempt + 1} failed: {str(e)}")
+            logger.error("Attempt %d failed: %s", attempt + 1, e)
             if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # Exponential backoff
-                print_warning(f"Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+                # Exponential backoff with jitter so concurrent retries don't line up
+                wait_time = min(MAX_BACKOFF, 2 ** attempt) + random.random()
+                logger.warning("Retrying in %.1f seconds...", wait_time)
+                await asyncio.sleep(wait_time)
             else:
-                print_error(f"Failed to generate article after {max_retries} attempts")
+                logger.error("Failed to generate article after %d attempts", max_retries)
                 return None
-
-def generate_meta_description(content):
-    """Generate SEO meta description from content."""
-    try:
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        prompt = f"""Generate a concise, SEO-friendly meta description (150-160 characters) for this article. 
-Return ONLY the description text, no quotes or extra formatting:
-
-{content[:500]}..."""
-        
-        response = model.generate_content(prompt)
-        description = response.text.strip().strip('"\'')
-        return description[:160]  # Ensure it's within limit
-    except:
-        # Fallback: Use first sentence
-        first_paragraph = content.split('\n\n')[1] if len(content.split('\n\n')) > 1 else content[:200]
-        return first_paragraph[:157] + "..."
-
-def generate_keywords(title, content):
-    """Generate SEO keywords from title and content."""
-    try:
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        prompt = f"""Generate 8-10 relevant SEO keywords for this article. Return as comma-separated list:
-
-Title: {title}
-Content: {content[:300]}..."""
-        
-        response = model.generate_content(prompt)
-        keywords = response.text.strip()
-        return keywords
-    except:
-        # Fallback: Use title words
-        return ", ".join(title.lower().split())
-
-def save_article_as_html(article_data, output_dir="blog"):
-    """Save article as HTML file."""
-    Path(output_dir).mkdir(exist_ok=True)
     
-    filename = article_data['title'].lower().replace(' ', '-').replace('/', '-')
-    filename = ''.join(c for c in filename if c.isalnum() or c == '-')
-    filepath = Path(output_dir) / f"{filename}.html"
+    # A local cache failure must not cost another API request
+    try:
+        cache.set(cache_key, article_data)
+    except sqlite3.Error as e:
+        logger.warning("Could not cache article '%s': %s", title, e)
     
-    html_content = f"""<!DOCTYPE html>
+    return article_data
+
+# HTML page layout; only the placeholders change between articles
+_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html lang="en">
 
 <head>
     <meta charset="UTF-8">
-    <meta name="description" content="{article_data['meta_description']}">
-    <meta name="keywords" content="{article_data['keywords']}">
+    <meta name="description" content="${meta_description}">
+    <meta name="keywords" content="${keywords}">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{article_data['title']}</title>
+    <title>${title}</title>
     <style>
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
             line-height: 1.6;
             max-width: 800px;
             margin: 0 auto;
             padding: 20px;
             color: #333;
-        }}
-        code {{
+        }
+        code {
             background-color: #f4f4f4;
             padding: 2px 6px;
             border-radius: 3px;
             font-family: 'Courier New', monospace;
-        }}
-        pre {{
+        }
+        pre {
             background-color: #f4f4f4;
             padding: 15px;
             border-radius: 5px;
             overflow-x: auto;
-        }}
-        pre code {{
+        }
+        pre code {
             background-color: transparent;
             padding: 0;
-        }}
-        img {{
+        }
+        img {
             max-width: 100%;
             height: auto;
-        }}
+        }
     </style>
 </head>
 
 <body>
     <markdown>
-{article_data['content']}
+${content}
     </markdown>
     <script src="https://cdn.jsdelivr.net/gh/OCEANOFANYTHINGOFFICIAL/mdonhtml.js/scripts/mdonhtml.min.js"></script>
 </body>
 
-</html>"""
+</html>""")
+
+# Maps spaces and slashes to hyphens and drops any other ASCII character
+# that is not alphanumeric or a hyphen
+_SLUG_TRANS = str.maketrans({
+    c: '-' if c in ' /' else None
+    for c in map(chr, range(128))
+    if c in ' /' or not (c.isalnum() or c == '-')
+})
+
+def _slugify(title):
+    """Turn an article title into a filename-safe slug."""
+    slug = title.lower().translate(_SLUG_TRANS)
+    if not slug.isascii():
+        # Only non-ASCII characters are left to filter
+        slug = ''.join(c for c in slug if c.isalnum() or c == '-')
+    return slug
+
+def save_article_as_html(article_data, output_dir="blog"):
+    """Save article as HTML file. The output directory must already exist."""
+    filepath = Path(output_dir) / f"{_slugify(article_data['title'])}.html"
+    
+    html_bytes = _HTML_TEMPLATE.substitute(
+        meta_description=article_data['meta_description'],
+        keywords=', '.join(article_data['keywords']),
+        title=article_data['title'],
+        content=article_data['content'],
+    ).encode('utf-8')
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    filepath.write_bytes(html_bytes)
     
-    print_success(f"Saved: {filepath}")
+    logger.log(SUCCESS, "Saved: %s", filepath)
     return str(filepath)
 
 def save_article_as_markdown(article_data, output_dir="blog"):
-    """Save article as Markdown file."""
-    Path(output_dir).mkdir(exist_ok=True)
-    
-    filename = article_data['title'].lower().replace(' ', '-').replace('/', '-')
-    filename = ''.join(c for c in filename if c.isalnum() or c == '-')
-    filepath = Path(output_dir) / f"{filename}.md"
+    """Save article as Markdown file. The output directory must already exist."""
+    filepath = Path(output_dir) / f"{_slugify(article_data['title'])}.md"
     
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(article_data['content'])
+    filepath.write_bytes(article_data['content'].encode('utf-8'))
     
-    print_success(f"Saved: {filepath}")
+    logger.log(SUCCESS, "Saved: %s", filepath)
     return str(filepath)
 
-def generate_bulk_articles(articles_list, output_format="html", output_dir="blog"):
+def filter_pending_articles(articles_list, output_format="html", output_dir="blog", force=False,
+                            skipped=None):
     """
-    Generate multiple articles from a list of titles and descriptions.
+    Drop duplicate titles and, unless forced, articles whose output file already exists.
     
     Args:
-        articles_list (list): List of dicts with 'title' and optional 'description'
+        articles_list (iterable): Dicts with 'title' and optional 'description'
+        output_format (str): 'html' or 'markdown'
+        output_dir (str): Directory articles are saved to
+        force (bool): Keep articles even if their output file already exists
+        skipped (list): If given, titles skipped because their file exists are appended to it
+    
+    Yields:
+        dict: Articles that still need to be generated, in input order
+    """
+    
+    existing = set()
+    if not force:
+        ext = "html" if output_format.lower() == 'html' else "md"
+        existing = {p.stem for p in Path(output_dir).glob(f"*.{ext}")}
+    
+    seen = set()
+    for article_info in articles_list:
+        title = article_info.get('title', '')
+        if title and title in seen:
+            logger.warning("Skipping duplicate title: %s", title)
+            continue
+        seen.add(title)
+        if title and _slugify(title) in existing:
+            logger.info("Skipping already generated article: %s", title)
+            if skipped is not None:
+                skipped.append(title)
+            continue
+        yield article_info
+
+async def generate_bulk_articles(articles_list, output_format="html", output_dir="blog",
+                                 max_concurrency=MAX_CONCURRENCY, write_summary=True, force=False,
+                                 shard=None):
+    """
+    Generate multiple articles from titles and descriptions.
+    
+    Articles are generated concurrently by `max_concurrency` workers that pull
+    topics from `articles_list` as they go, so at most that many Gemini requests
+    are in flight at once and a generator of topics is never fully loaded into
+    memory.
+    
+    Args:
+        articles_list (iterable): Dicts with 'title' and optional 'description'
         output_format (str): 'html' or 'markdown'
         output_dir (str): Directory to save articles
+        max_concurrency (int): Maximum number of articles generated at once
+        write_summary (bool): Whether to save generation_summary.json when done
+        force (bool): Rewrite articles whose output file already exists (cached articles
+            are rewritten from the response cache without an API call)
+        shard (tuple): (offset, overall_total) when running as one shard of a sharded
+            run; articles are numbered from offset + 1 against the overall total and
+            the start/finish messages are left to the caller
     
     Returns:
-        list: Generated article data
+        list: Generated article data, in input order
     """
     
-    print_step(f"Starting bulk generation of {len(articles_list)} articles...")
-    print_step(f"Output format: {output_format.upper()}")
-    print_step(f"Output directory: {output_dir}")
-    print()
+    Path(output_dir).mkdir(exist_ok=True)
+    skipped = []
+    pending = filter_pending_articles(articles_list, output_format, output_dir, force, skipped)
     
-    results = []
+    # Sized inputs are already in memory, so count what is left to generate;
+    # for streamed inputs the total is unknown
+    try:
+        len(articles_list)
+    except TypeError:
+        total = None
+    else:
+        pending = list(pending)
+        total = len(pending)
     
-    for i, article_info in enumerate(articles_list, 1):
-        print(f"\n{'='*80}")
-        print(f"Article {i}/{len(articles_list)}")
-        print(f"{'='*80}\n")
-        
+    offset = 0
+    if shard is not None:
+        offset, total = shard
+    else:
+        logger.info("Starting bulk generation of %s articles...", total if total is not None else "?")
+        logger.info("Output format: %s", output_format.upper())
+        logger.info("Output directory: %s", output_dir)
+        logger.info("Max concurrency: %d", max_concurrency)
+        write_banner("\n")
+    
+    async def process_article(i, article_info):
         title = article_info.get('title', '')
         description = article_info.get('description', '')
         
         if not title:
-            print_warning(f"Skipping article {i}: No title provided")
-            continue
+            logger.warning("Skipping article %d: No title provided", i)
+            return None
+        
+        write_banner(f"\n{'='*80}\nArticle {i}/{total if total is not None else '?'}\n{'='*80}\n\n")
         
         # Generate article
-        article_data = generate_article_with_gemini(title, description)
+        article_data = await generate_article_with_gemini(title, description)
         
         if article_data:
-            # Save article
+            # Save article off the event loop so disk work overlaps in-flight API calls
             if output_format.lower() == 'html':
-                filepath = save_article_as_html(article_data, output_dir)
+                filepath = await asyncio.to_thread(save_article_as_html, article_data, output_dir)
             else:
-                filepath = save_article_as_markdown(article_data, output_dir)
+                filepath = await asyncio.to_thread(save_article_as_markdown, article_data, output_dir)
             
             article_data['filepath'] = filepath
-            results.append(article_data)
-            
-            # Add delay to respect API rate limits
-            if i < len(articles_list):
-                time.sleep(2)
-        else:
-            print_error(f"Failed to generate article: {title}")
+            return article_data
+        
+        logger.error("Failed to generate article: %s", title)
+        return None
+    
+    # Workers share one iterator; each next() runs without yielding to the event
+    # loop, so no topic is handed out twice
+    numbered = enumerate(pending, offset + 1)
+    generated = {}
+    processed = 0
+    
+    async def worker():
+        nonlocal processed
+        for i, article_info in numbered:
+            processed = i
+            article_data = await process_article(i, article_info)
+            if article_data:
+                generated[i] = article_data
     
-    print(f"\n{'='*80}")
-    print_success(f"Bulk generation complete! Generated {len(results)}/{len(articles_list)} articles")
-    print(f"{'='*80}\n")
+    await asyncio.gather(*(worker() for _ in range(max_concurrency)))
+    results = [generated[i] for i in sorted(generated)]
+    
+    if shard is None:
+        write_banner(f"\n{'='*80}\n")
+        logger.log(SUCCESS, "Bulk generation complete! Generated %d/%d articles, skipped %d already generated",
+                   len(results), processed, len(skipped))
+        write_banner(f"{'='*80}\n\n")
     
     # Save summary
-    save_generation_summary(results, output_dir)
+    if write_summary:
+        save_generation_summary(results, output_dir, skipped)
+    
+    return results
+
+def _run_chunk(articles_chunk, output_format, output_dir, max_concurrency, log_level, quiet_capacity,
+               shard):
+    """Generate one shard of articles on its own event loop in a worker process."""
+    logger.setLevel(log_level)
+    # Worker processes exit without running atexit hooks, so flush the quiet buffer here
+    tail_handler = enable_quiet_mode(quiet_capacity) if quiet_capacity else None
+    try:
+        return asyncio.run(generate_bulk_articles(
+            articles_chunk,
+            output_format=output_format,
+            output_dir=output_dir,
+            max_concurrency=max_concurrency,
+            write_summary=False,
+            force=True,  # Already filtered by the parent process
+            shard=shard
+        ))
+    finally:
+        if tail_handler is not None:
+            tail_handler.flush()
+
+def generate_bulk_articles_sharded(articles_list, output_format="html", output_dir="blog",
+                                   max_concurrency=MAX_CONCURRENCY, workers=None, force=False):
+    """
+    Generate articles across several processes, each running its own event loop.
+    
+    The topics are split into contiguous chunks, one per worker, and the
+    concurrency budget is divided between workers so the total number of
+    in-flight Gemini requests still stays within `max_concurrency`. The
+    number of workers is capped at `max_concurrency` for the same reason.
+    
+    Each worker process has its own Gemini connection, so each one sends its
+    own warm-up request on its first cache miss (see WARMUP).
+    
+    Args:
+        articles_list (iterable): Dicts with 'title' and optional 'description'; read
+            fully up front so it can be split into chunks
+        output_format (str): 'html' or 'markdown'
+        output_dir (str): Directory to save articles
+        max_concurrency (int): Maximum number of articles generated at once, across all workers
+        workers (int): Number of worker processes (defaults to the CPU count, at most max_concurrency)
+        force (bool): Rewrite articles whose output file already exists (cached articles
+            are rewritten from the response cache without an API call)
+    
+    Returns:
+        list: Generated article data, in the order of articles_list
+    """
+    
+    Path(output_dir).mkdir(exist_ok=True)
+    skipped = []
+    articles_list = list(filter_pending_articles(articles_list, output_format, output_dir, force, skipped))
+    if skipped:
+        logger.info("Skipped %d already generated articles", len(skipped))
+    
+    workers = min(workers or os.cpu_count() or 1, max_concurrency, len(articles_list))
+    if workers <= 1:
+        results = asyncio.run(generate_bulk_articles(
+            articles_list,
+            output_format=output_format,
+            output_dir=output_dir,
+            max_concurrency=max_concurrency,
+            write_summary=False,
+            force=True  # Already filtered above
+        ))
+        save_generation_summary(results, output_dir, skipped)
+        return results
+    
+    chunk_size = -(-len(articles_list) // workers)
+    chunks = [articles_list[i:i + chunk_size] for i in range(0, len(articles_list), chunk_size)]
+    per_worker_concurrency = max_concurrency // len(chunks)
+    
+    logger.info("Starting sharded generation of %d articles across %d processes...",
+                len(articles_list), len(chunks))
+    logger.info("Output format: %s", output_format.upper())
+    logger.info("Output directory: %s", output_dir)
+    logger.info("Max concurrency: %d (%d per process)", max_concurrency, per_worker_concurrency)
+    write_banner("\n")
+    
+    # Workers rebuild quiet mode with the same tail size
+    quiet_capacity = next(
+        (h.buffer.maxlen for h in logger.handlers if isinstance(h, TailBufferHandler)), None
+    )
+    
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        shard_results = executor.map(
+            _run_chunk,
+            chunks,
+            [output_format] * len(chunks),
+            [output_dir] * len(chunks),
+            [per_worker_concurrency] * len(chunks),
+            [logger.level] * len(chunks),
+            [quiet_capacity] * len(chunks),
+            [(i * chunk_size, len(articles_list)) for i in range(len(chunks))]
+        )
+        results = [article_data for shard in shard_results for article_data in shard]
+    
+    write_banner(f"\n{'='*80}\n")
+    logger.log(SUCCESS, "Sharded generation complete! Generated %d/%d articles, skipped %d already generated",
+               len(results), len(articles_list), len(skipped))
+    write_banner(f"{'='*80}\n\n")
+    
+    save_generation_summary(results, output_dir, skipped)
     
     return results
 
-def save_generation_summary(results, output_dir):
-    """Save a summary of generated articles."""
+def save_generation_summary(results, output_dir, skipped_titles=()):
+    """
+    Save a summary of generated articles.
+    
+    Entries for articles skipped because they were already generated are
+    carried over from the existing summary, so a re-run doesn't lose them.
+    If nothing new was generated and articles were skipped, the existing
+    summary is left untouched.
+    
+    Args:
+        results (list): Article data generated in this run
+        output_dir (str): Directory holding generation_summary.json
+        skipped_titles (iterable): Titles skipped because their output file already exists
+    """
     summary_path = Path(output_dir) / "generation_summary.json"
     
+    if not results and skipped_titles:
+        logger.info("No new articles generated; leaving %s unchanged", summary_path)
+        return
+    
+    entries = [
+        {
+            "title": r['title'],
+            "filepath": r['filepath'],
+            "word_count": r['word_count'],
+            "meta_description": r['meta_description']
+        }
+        for r in results
+    ]
+    
+    carried_titles = set(skipped_titles) - {entry['title'] for entry in entries}
+    if carried_titles:
+        try:
+            previous = json.loads(summary_path.read_bytes())
+        except (OSError, ValueError):
+            previous = {}
+        carried = [
+            entry for entry in previous.get("articles", [])
+            if entry.get('title') in carried_titles
+        ]
+        entries = carried + entries
+    
     summary = {
-        "total_articles": len(results),
+        "total_articles": len(entries),
         "generation_date": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "articles": [
-            {
-                "title": r['title'],
-                "filepath": r['filepath'],
-                "word_count": r['word_count'],
-                "meta_description": r['meta_description']
-            }
-            for r in results
-        ]
+        "articles": entries
     }
     
-    with open(summary_path, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        summary_path.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    else:
+        summary_path.write_bytes(json.dumps(summary, indent=2, ensure_ascii=False).encode('utf-8'))
     
-    print_success(f"Generation summary saved: {summary_path}")
+    logger.log(SUCCESS, "Generation summary saved: %s", summary_path)
 
 # Example usage with 10 programming topics
 if __name__ == "__main__":
     
+    parser = argparse.ArgumentParser(description="Generate blog articles in bulk with Gemini.")
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["INFO", "SUCCESS", "WARNING", "ERROR"],
+        help="Only show messages at or above this level (default: INFO)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to shard generation across (default: 1)"
+    )
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help=f"Hold log output in memory and only print the last {QUIET_TAIL} messages on exit or failure"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite articles even if their output file already exists (uses cached responses when available)"
+    )
+    args = parser.parse_args()
+    logger.setLevel(args.log_level)
+    if args.quiet:
+        enable_quiet_mode()
+    
     # Define your 10 article topics here
     ARTICLE_TOPICS = [
         {
@@ -363,17 +844,26 @@ if __name__ == "__main__":
     ]
     
     # Generate all articles
-    results = generate_bulk_articles(
-        articles_list=ARTICLE_TOPICS,
-        output_format="html",  # or "markdown"
-        output_dir="blog"
-    )
+    if args.workers > 1:
+        results = generate_bulk_articles_sharded(
+            articles_list=ARTICLE_TOPICS,
+            output_format="html",  # or "markdown"
+            output_dir="blog",
+            workers=args.workers,
+            force=args.force
+        )
+    else:
+        results = asyncio.run(generate_bulk_articles(
+            articles_list=ARTICLE_TOPICS,
+            output_format="html",  # or "markdown"
+            output_dir="blog",
+            force=args.force
+        ))
     
     # Print final summary
-    print("\n" + "="*80)
-    print("GENERATION SUMMARY")
-    print("="*80)
+    summary_lines = ["", "="*80, "GENERATION SUMMARY", "="*80]
     for i, result in enumerate(results, 1):
-        print(f"{i}. {result['title']}")
-        print(f"   Words: {result['word_count']} | File: {result['filepath']}")
-    print("="*80)
+        summary_lines.append(f"{i}. {result['title']}")
+        summary_lines.append(f"   Words: {result['word_count']} | File: {result['filepath']}")
+    summary_lines.append("="*80)
+    write_banner("\n".join(summary_lines) + "\n")